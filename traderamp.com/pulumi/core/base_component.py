@@ -4,7 +4,7 @@ Base component class following DRY principle.
 Provides common functionality for all infrastructure components.
 """
 
-from typing import Dict, Optional, Any, List
+from typing import Dict, Optional, Any, List, Tuple
 from abc import ABC, abstractmethod
 import pulumi
 from pulumi import ComponentResource, ResourceOptions, Output
@@ -44,6 +44,10 @@ class BaseInfrastructureComponent(ComponentResource, ABC):
         self.name = name
         self.tagger = tagger
         self._resources: Dict[str, Any] = {}
+        self._tag_cache: Dict[Tuple[str, str], Dict[str, str]] = {}
+        
+        # Shared options for child resources (Pulumi copies them on use)
+        self._opts = ResourceOptions(parent=self)
         
         # Validate component configuration
         self.validate()
@@ -82,6 +86,9 @@ class BaseInfrastructureComponent(ComponentResource, ABC):
         """
         Get tags for a resource.
         
+        Results are memoized per (resource_type, resource_name), so repeated
+        lookups share one dictionary. Callers must not mutate it.
+        
         Args:
             resource_type: Type of the resource
             resource_name: Name of the resource
@@ -89,6 +96,14 @@ class BaseInfrastructureComponent(ComponentResource, ABC):
         Returns:
             Dictionary of tags
         """
+        key = (resource_type, resource_name)
+        tags = self._tag_cache.get(key)
+        if tags is None:
+            tags = self._tag_cache[key] = self._build_tags(resource_type, resource_name)
+        return tags
+    
+    def _build_tags(self, resource_type: str, resource_name: str) -> Dict[str, str]:
+        """Build tags for a resource without consulting the cache."""
         if self.tagger:
             return self.tagger.get_tags(resource_type, resource_name)
         
@@ -99,6 +114,18 @@ class BaseInfrastructureComponent(ComponentResource, ABC):
             "ManagedBy": "Pulumi"
         }
     
+    def _opts_with_depends(self, depends_on: List[Any]) -> ResourceOptions:
+        """
+        Get child resource options with explicit dependencies.
+        
+        Args:
+            depends_on: Resources the child must be created after
+            
+        Returns:
+            Resource options parented to this component
+        """
+        return ResourceOptions(parent=self, depends_on=depends_on)
+    
     def add_resource(self, key: str, resource: Any) -> None:
         """
         Add a resource to the component's resource collection.
@@ -110,6 +137,22 @@ class BaseInfrastructureComponent(ComponentResource, ABC):
         self._resources[key] = resource
         self._log_resource_creation(key, resource)
     
+    def add_resources(self, resources: Dict[str, Any]) -> None:
+        """
+        Add several resources to the component's resource collection at once.
+        
+        The batch is reported in a single log message, since each
+        pulumi.log call is a blocking round trip to the engine.
+        
+        Args:
+            resources: Mapping of resource identifier to resource instance
+        """
+        self._resources.update(resources)
+        created = ", ".join(
+            f"{type(resource).__name__} '{key}'" for key, resource in resources.items()
+        )
+        pulumi.log.info(f"Created {created} in component '{self.name}'")
+    
     def get_resource(self, key: str) -> Optional[Any]:
         """
         Get a resource by key.
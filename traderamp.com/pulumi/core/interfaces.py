@@ -7,7 +7,7 @@ on low-level modules. Both should depend on abstractions.
 
 from abc import ABC, abstractmethod
 from typing import Protocol, List, Dict, Optional, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pulumi import Input, Output
 
 
@@ -81,7 +81,7 @@ class IContainerOrchestrator(ABC):
         pass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class HealthCheckSpec:
     """Health check specification - cloud agnostic."""
     
@@ -106,7 +106,7 @@ class HealthCheckSpec:
             raise ValueError("Unhealthy threshold must be at least 1")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ScalingSpec:
     """Auto-scaling specification - cloud agnostic."""
     
@@ -135,7 +135,7 @@ class ScalingSpec:
             raise ValueError("Target memory must be between 0 and 100")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ContainerSpec:
     """Container specification - cloud agnostic."""
     
@@ -146,12 +146,20 @@ class ContainerSpec:
     environment_variables: Dict[str, str] = None
     secrets: Dict[str, str] = None
     
+    # Environment variables as a list of name/value pairs, derived in __post_init__
+    environment_list: List[Dict[str, str]] = field(init=False, repr=False, compare=False)
+    
     def __post_init__(self):
         """Initialize with defaults."""
+        # Frozen dataclass: defaults and derived fields are set via object.__setattr__
         if self.environment_variables is None:
-            self.environment_variables = {}
+            object.__setattr__(self, "environment_variables", {})
         if self.secrets is None:
-            self.secrets = {}
+            object.__setattr__(self, "secrets", {})
+        object.__setattr__(self, "environment_list", [
+            {"name": k, "value": v}
+            for k, v in self.environment_variables.items()
+        ])
     
     def validate(self) -> None:
         """Validate container configuration."""
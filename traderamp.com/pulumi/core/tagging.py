@@ -6,11 +6,18 @@ Each strategy has a single responsibility for tag generation.
 
 from typing import Dict, Optional, List
 from datetime import datetime
+from functools import lru_cache
 from abc import ABC, abstractmethod
 
 from .interfaces import IResourceTagger
 
 
+@lru_cache(maxsize=1)
+def _run_timestamp() -> str:
+    """Timestamp for this program run, shared by every tagging strategy."""
+    return datetime.utcnow().isoformat()
+
+
 class BaseTaggingStrategy(IResourceTagger, ABC):
     """Base class for tagging strategies."""
     
@@ -48,10 +55,11 @@ class BaseTaggingStrategy(IResourceTagger, ABC):
         Returns:
             Dictionary of tags
         """
-        tags = self.base_tags.copy()
-        tags.update(self.get_strategy_tags(resource_type, resource_name))
-        tags["Name"] = resource_name  # Always include Name tag
-        return tags
+        return {
+            **self.base_tags,
+            **self.get_strategy_tags(resource_type, resource_name),
+            "Name": resource_name  # Always include Name tag
+        }
 
 
 class StandardTaggingStrategy(BaseTaggingStrategy):
@@ -78,7 +86,7 @@ class StandardTaggingStrategy(BaseTaggingStrategy):
             "Project": project,
             "Environment": environment,
             "ManagedBy": "Pulumi",
-            "CreatedAt": datetime.utcnow().isoformat()
+            "CreatedAt": _run_timestamp()
         }
         
         if owner:
@@ -88,13 +96,24 @@ class StandardTaggingStrategy(BaseTaggingStrategy):
             base_tags["CostCenter"] = cost_center
         
         super().__init__(base_tags)
+        
+        # Strategy tags depend only on the resource type; build each once
+        self._type_tags: Dict[str, Dict[str, str]] = {}
     
     def get_strategy_tags(self, resource_type: str, resource_name: str) -> Dict[str, str]:
-        """Get standard strategy tags."""
-        return {
-            "ResourceType": resource_type,
-            "Purpose": self._get_purpose(resource_type)
-        }
+        """
+        Get standard strategy tags.
+        
+        The returned dictionary is shared per resource type and must not be
+        mutated.
+        """
+        tags = self._type_tags.get(resource_type)
+        if tags is None:
+            tags = self._type_tags[resource_type] = {
+                "ResourceType": resource_type,
+                "Purpose": self._get_purpose(resource_type)
+            }
+        return tags
     
     def _get_purpose(self, resource_type: str) -> str:
         """Get purpose tag based on resource type."""
@@ -138,15 +157,12 @@ class ComplianceTaggingStrategy(StandardTaggingStrategy):
     
     def get_strategy_tags(self, resource_type: str, resource_name: str) -> Dict[str, str]:
         """Get compliance strategy tags."""
-        tags = super().get_strategy_tags(resource_type, resource_name)
-        
-        tags.update({
+        return {
+            **super().get_strategy_tags(resource_type, resource_name),
             "DataClassification": self.data_classification,
             "ComplianceFramework": self.compliance_framework,
             "Encrypted": self._requires_encryption(resource_type)
-        })
-        
-        return tags
+        }
     
     def _requires_encryption(self, resource_type: str) -> str:
         """Determine if resource type requires encryption."""
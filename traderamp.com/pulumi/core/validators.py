@@ -4,13 +4,16 @@ Validators following Single Responsibility Principle.
 Each validator has one reason to change.
 """
 
-from typing import Any, List, Tuple, Optional
+from typing import Any, Callable, List, Optional
 from abc import ABC, abstractmethod
+from functools import partial
 
 
 class IValidator(ABC):
     """Base interface for validators."""
     
+    __slots__ = ()
+    
     @abstractmethod
     def validate(self, value: Any) -> None:
         """
@@ -28,6 +31,8 @@ class IValidator(ABC):
 class RangeValidator(IValidator):
     """Validates numeric values are within a range."""
     
+    __slots__ = ("min_value", "max_value", "name")
+    
     def __init__(self, min_value: float, max_value: float, name: str):
         """
         Initialize range validator.
@@ -56,6 +61,8 @@ class RangeValidator(IValidator):
 class StringPatternValidator(IValidator):
     """Validates strings match a pattern."""
     
+    __slots__ = ("pattern", "name")
+    
     def __init__(self, pattern: str, name: str):
         """
         Initialize pattern validator.
@@ -82,6 +89,8 @@ class StringPatternValidator(IValidator):
 class ListLengthValidator(IValidator):
     """Validates list length constraints."""
     
+    __slots__ = ("min_length", "max_length", "name")
+    
     def __init__(self, min_length: int, max_length: Optional[int], name: str):
         """
         Initialize list length validator.
@@ -118,6 +127,8 @@ class ListLengthValidator(IValidator):
 class FargateResourceValidator(IValidator):
     """Validates AWS Fargate resource combinations."""
     
+    __slots__ = ()
+    
     # Valid CPU/memory combinations for Fargate
     VALID_COMBINATIONS = {
         256: range(512, 2049, 512),      # 512, 1024, 1536, 2048
@@ -156,6 +167,8 @@ class FargateResourceValidator(IValidator):
 class CompositeValidator(IValidator):
     """Combines multiple validators."""
     
+    __slots__ = ("validators",)
+    
     def __init__(self, validators: List[IValidator]):
         """
         Initialize composite validator.
@@ -174,9 +187,13 @@ class CompositeValidator(IValidator):
 class ValidationContext:
     """Context for managing validations - follows Open/Closed Principle."""
     
+    __slots__ = ("_names", "_checks")
+    
     def __init__(self):
         """Initialize validation context."""
-        self._validators: List[Tuple[str, IValidator, Any]] = []
+        # Parallel lists: _names[i] labels the check bound in _checks[i]
+        self._names: List[str] = []
+        self._checks: List[Callable[[], None]] = []
     
     def add_validation(self, name: str, validator: IValidator, value: Any) -> 'ValidationContext':
         """
@@ -190,21 +207,36 @@ class ValidationContext:
         Returns:
             Self for chaining
         """
-        self._validators.append((name, validator, value))
+        # Bind the value up front so validate_all only has to call a thunk
+        self._names.append(name)
+        self._checks.append(partial(validator.validate, value))
         return self
     
-    def validate_all(self) -> None:
+    def validate_all(self, collect_errors: bool = False) -> None:
         """
         Run all validations.
         
+        Args:
+            collect_errors: Run every validation and report all failures
+                together instead of stopping at the first one
+            
         Raises:
             ValueError: If any validation fails
         """
+        if not collect_errors:
+            # Fail fast: a single try around the loop, no per-check setup
+            try:
+                for name, check in zip(self._names, self._checks):
+                    check()
+            except ValueError as e:
+                raise ValueError(f"Validation failed:\n{name}: {str(e)}") from None
+            return
+        
         errors = []
         
-        for name, validator, value in self._validators:
+        for name, check in zip(self._names, self._checks):
             try:
-                validator.validate(value)
+                check()
             except ValueError as e:
                 errors.append(f"{name}: {str(e)}")
         
@@ -1,32 +1,50 @@
-"""AWS provider implementations."""
+"""AWS provider implementations.
 
-from .networking import VPCComponent, LoadBalancerComponent, AWSNetworkProvider
-from .security import SecurityGroupComponent, SecurityGroupFactory, SecurityRule
-from .compute import FargateServiceComponent
-from .storage import ContainerRegistryComponent
-from .certificates import CertificateComponent
-from .dns import DNSComponent
+Components are imported lazily on first attribute access so that importing
+one provider module does not pull in every other ``pulumi_aws`` submodule.
+"""
 
-__all__ = [
+from importlib import import_module
+
+# Maps each exported name to the submodule that defines it
+_EXPORTS = {
     # Networking
-    "VPCComponent",
-    "LoadBalancerComponent",
-    "AWSNetworkProvider",
+    "VPCComponent": "networking",
+    "LoadBalancerComponent": "networking",
+    "AWSNetworkProvider": "networking",
     
     # Security
-    "SecurityGroupComponent",
-    "SecurityGroupFactory",
-    "SecurityRule",
+    "SecurityGroupComponent": "security",
+    "SecurityGroupFactory": "security",
+    "SecurityRule": "security",
     
     # Compute
-    "FargateServiceComponent",
+    "FargateServiceComponent": "compute",
     
     # Storage
-    "ContainerRegistryComponent",
+    "ContainerRegistryComponent": "storage",
     
     # Certificates
-    "CertificateComponent",
+    "CertificateComponent": "certificates",
     
     # DNS
-    "DNSComponent"
-]
\ No newline at end of file
+    "DNSComponent": "dns"
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    """Import the defining submodule on first access to an exported name."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # Cache so later lookups bypass __getattr__
+    return value
+
+
+def __dir__():
+    """Include lazily exported names in dir()."""
+    return sorted(set(globals()) | set(__all__))
\ No newline at end of file
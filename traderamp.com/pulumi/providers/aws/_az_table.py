@@ -0,0 +1,36 @@
+"""
+Static availability zone names for regions this project deploys to.
+
+Used instead of the DescribeAvailabilityZones lookup when the configured
+region is listed here. Only zones open to every account are included, in
+the same order the live lookup returns them, so existing subnets keep
+their zones.
+"""
+
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+import pulumi
+
+
+_REGION_AZS: Dict[str, Tuple[str, ...]] = {
+    "us-east-1": ("us-east-1a", "us-east-1b", "us-east-1c", "us-east-1d", "us-east-1f"),
+    "us-east-2": ("us-east-2a", "us-east-2b", "us-east-2c"),
+    "us-west-2": ("us-west-2a", "us-west-2b", "us-west-2c", "us-west-2d"),
+    "ca-central-1": ("ca-central-1a", "ca-central-1b", "ca-central-1d"),
+    "eu-west-1": ("eu-west-1a", "eu-west-1b", "eu-west-1c"),
+    "eu-west-2": ("eu-west-2a", "eu-west-2b", "eu-west-2c"),
+    "eu-central-1": ("eu-central-1a", "eu-central-1b", "eu-central-1c"),
+}
+
+
+@lru_cache(maxsize=1)
+def get_static_availability_zones() -> Optional[Tuple[str, ...]]:
+    """
+    Get the availability zones for the configured AWS region, if known.
+    
+    Returns:
+        Zone names for aws:region, or None when the region is not set or not
+        in the table and the live lookup is needed
+    """
+    region = pulumi.Config("aws").get("region")
+    return _REGION_AZS.get(region) if region else None
\ No newline at end of file
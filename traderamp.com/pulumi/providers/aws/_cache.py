@@ -0,0 +1,27 @@
+"""
+Memoized AWS data-source lookups shared by provider components.
+
+Data sources are pure for a given provider within one Pulumi program run,
+so each distinct lookup only needs to be invoked once.
+"""
+
+from functools import lru_cache
+import pulumi_aws as aws
+from pulumi import Output
+
+
+@lru_cache(maxsize=None)
+def get_availability_zones(state: str = "available") -> Output[aws.GetAvailabilityZonesResult]:
+    """
+    Get the availability zones in the provider region.
+    
+    Uses the Output form of the invoke so resource registration is not
+    blocked waiting on the RPC.
+    
+    Args:
+        state: Availability zone state to filter by
+        
+    Returns:
+        The availability zones lookup result
+    """
+    return aws.get_availability_zones_output(state=state)
\ No newline at end of file
@@ -8,25 +8,81 @@ This module provides CloudFront distribution management with:
 - Custom error pages
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Sequence
 import pulumi
-from pulumi import ResourceOptions
 from pulumi_aws import cloudfront, acm
 
 from core.base_component import BaseInfrastructureComponent
 from core.interfaces import IResourceTagger
 
 
+# Default allowed/cached methods for cache behaviors (shared, immutable)
+_DEFAULT_METHODS = ("GET", "HEAD")
+
+# (path pattern, default TTL) for static asset cache behaviors
+_STATIC_CACHE_RULES = (
+    ("*.css", 604800),   # 7 days
+    ("*.js", 604800),    # 7 days
+    ("*.jpg", 2592000),  # 30 days
+    ("*.png", 2592000),  # 30 days
+)
+
+# Origin settings shared by every ALB-backed distribution
+_ALB_CUSTOM_ORIGIN_CONFIG = cloudfront.DistributionOriginCustomOriginConfigArgs(
+    http_port=80,
+    https_port=443,
+    origin_protocol_policy="https-only",  # Only use HTTPS to origin
+    origin_ssl_protocols=["TLSv1.2"],
+    origin_keepalive_timeout=5,
+    origin_read_timeout=30
+)
+
+# Custom error pages
+_CUSTOM_ERROR_RESPONSES = (
+    cloudfront.DistributionCustomErrorResponseArgs(
+        error_code=404,
+        response_code=404,
+        response_page_path="/404.html",
+        error_caching_min_ttl=300
+    ),
+    cloudfront.DistributionCustomErrorResponseArgs(
+        error_code=403,
+        response_code=403,
+        response_page_path="/403.html",
+        error_caching_min_ttl=300
+    )
+)
+
+# Geo restrictions (none by default)
+_NO_GEO_RESTRICTION = cloudfront.DistributionRestrictionsArgs(
+    geo_restriction=cloudfront.DistributionRestrictionsGeoRestrictionArgs(
+        restriction_type="none"
+    )
+)
+
+
 class CacheBehaviorSpec:
     """Specification for CloudFront cache behavior."""
     
+    __slots__ = (
+        "path_pattern",
+        "target_origin_id",
+        "viewer_protocol_policy",
+        "allowed_methods",
+        "cached_methods",
+        "default_ttl",
+        "max_ttl",
+        "min_ttl",
+        "compress"
+    )
+    
     def __init__(
         self,
         path_pattern: str,
         target_origin_id: str,
         viewer_protocol_policy: str = "redirect-to-https",
-        allowed_methods: List[str] = None,
-        cached_methods: List[str] = None,
+        allowed_methods: Optional[Sequence[str]] = None,
+        cached_methods: Optional[Sequence[str]] = None,
         default_ttl: int = 86400,  # 24 hours
         max_ttl: int = 31536000,   # 1 year
         min_ttl: int = 0,
@@ -49,8 +105,8 @@ class CacheBehaviorSpec:
         self.path_pattern = path_pattern
         self.target_origin_id = target_origin_id
         self.viewer_protocol_policy = viewer_protocol_policy
-        self.allowed_methods = allowed_methods or ["GET", "HEAD"]
-        self.cached_methods = cached_methods or ["GET", "HEAD"]
+        self.allowed_methods = allowed_methods if allowed_methods is not None else _DEFAULT_METHODS
+        self.cached_methods = cached_methods if cached_methods is not None else _DEFAULT_METHODS
         self.default_ttl = default_ttl
         self.max_ttl = max_ttl
         self.min_ttl = min_ttl
@@ -64,13 +120,19 @@ class CloudFrontComponent(BaseInfrastructureComponent):
     Provides global content delivery with caching and HTTPS enforcement.
     """
     
+    _VALID_PRICE_CLASSES = frozenset({
+        "PriceClass_All",
+        "PriceClass_100",
+        "PriceClass_200"
+    })
+    
     def __init__(
         self,
         name: str,
         origin_domain_name: pulumi.Output[str],
         origin_id: str = "alb-origin",
         certificate_arn: Optional[str] = None,
-        domain_aliases: Optional[List[str]] = None,
+        domain_aliases: Optional[Sequence[str]] = None,
         enable_ipv6: bool = True,
         price_class: str = "PriceClass_100",  # US, Canada, Europe
         default_root_object: str = "index.html",
@@ -103,6 +165,10 @@ class CloudFrontComponent(BaseInfrastructureComponent):
         self.default_root_object = default_root_object
         self.enable_logging = enable_logging
         
+        # Resource names
+        self._oai_name = f"{name}-oai"
+        self._cdn_name = f"{name}-cdn"
+        
         # Initialize base component
         super().__init__(
             component_type="aws:cloudfront:Distribution",
@@ -114,47 +180,23 @@ class CloudFrontComponent(BaseInfrastructureComponent):
         """Create CloudFront distribution resources."""
         # Create origin access identity for future S3 use
         self.oai = cloudfront.OriginAccessIdentity(
-            f"{self.name}-oai",
+            self._oai_name,
             comment=f"OAI for {self.name}",
-            opts=ResourceOptions(parent=self)
-        )
-        
-        # Define cache behaviors
-        static_assets_behavior = self._create_cache_behavior(
-            CacheBehaviorSpec(
-                path_pattern="*.css",
-                target_origin_id=self.origin_id,
-                default_ttl=604800,  # 7 days
-                max_ttl=31536000     # 1 year
-            )
-        )
-        
-        js_assets_behavior = self._create_cache_behavior(
-            CacheBehaviorSpec(
-                path_pattern="*.js",
-                target_origin_id=self.origin_id,
-                default_ttl=604800,  # 7 days
-                max_ttl=31536000     # 1 year
-            )
-        )
-        
-        image_assets_behavior = self._create_cache_behavior(
-            CacheBehaviorSpec(
-                path_pattern="*.jpg",
-                target_origin_id=self.origin_id,
-                default_ttl=2592000,  # 30 days
-                max_ttl=31536000      # 1 year
-            )
+            opts=self._opts
         )
         
-        png_assets_behavior = self._create_cache_behavior(
-            CacheBehaviorSpec(
-                path_pattern="*.png",
-                target_origin_id=self.origin_id,
-                default_ttl=2592000,  # 30 days
-                max_ttl=31536000      # 1 year
+        # Define cache behaviors for static assets
+        static_asset_behaviors = [
+            self._create_cache_behavior(
+                CacheBehaviorSpec(
+                    path_pattern=path_pattern,
+                    target_origin_id=self.origin_id,
+                    default_ttl=default_ttl,
+                    max_ttl=31536000  # 1 year
+                )
             )
-        )
+            for path_pattern, default_ttl in _STATIC_CACHE_RULES
+        ]
         
         # Create distribution
         distribution_args = {
@@ -185,35 +227,13 @@ class CloudFrontComponent(BaseInfrastructureComponent):
             ),
             
             # Ordered cache behaviors for static assets
-            "ordered_cache_behaviors": [
-                static_assets_behavior,
-                js_assets_behavior,
-                image_assets_behavior,
-                png_assets_behavior
-            ],
+            "ordered_cache_behaviors": static_asset_behaviors,
             
             # Custom error responses
-            "custom_error_responses": [
-                cloudfront.DistributionCustomErrorResponseArgs(
-                    error_code=404,
-                    response_code=404,
-                    response_page_path="/404.html",
-                    error_caching_min_ttl=300
-                ),
-                cloudfront.DistributionCustomErrorResponseArgs(
-                    error_code=403,
-                    response_code=403,
-                    response_page_path="/403.html",
-                    error_caching_min_ttl=300
-                )
-            ],
+            "custom_error_responses": list(_CUSTOM_ERROR_RESPONSES),
             
             # Geo restrictions (none by default)
-            "restrictions": cloudfront.DistributionRestrictionsArgs(
-                geo_restriction=cloudfront.DistributionRestrictionsGeoRestrictionArgs(
-                    restriction_type="none"
-                )
-            ),
+            "restrictions": _NO_GEO_RESTRICTION,
             
             # Viewer certificate
             "viewer_certificate": self._get_viewer_certificate()
@@ -229,31 +249,26 @@ class CloudFrontComponent(BaseInfrastructureComponent):
             pass
         
         # Add tags
-        distribution_args["tags"] = self.get_tags("cloudfront", f"{self.name}-cdn")
+        distribution_args["tags"] = self.get_tags("cloudfront", self._cdn_name)
         
         self.distribution = cloudfront.Distribution(
-            f"{self.name}-cdn",
-            opts=ResourceOptions(parent=self),
+            self._cdn_name,
+            opts=self._opts,
             **distribution_args
         )
         
         # Add resources to component collection
-        self.add_resource("oai", self.oai)
-        self.add_resource("distribution", self.distribution)
+        self.add_resources({
+            "oai": self.oai,
+            "distribution": self.distribution
+        })
     
     def _create_alb_origin(self) -> cloudfront.DistributionOriginArgs:
         """Create ALB origin configuration."""
         return cloudfront.DistributionOriginArgs(
             domain_name=self.origin_domain_name,
             origin_id=self.origin_id,
-            custom_origin_config=cloudfront.DistributionOriginCustomOriginConfigArgs(
-                http_port=80,
-                https_port=443,
-                origin_protocol_policy="https-only",  # Only use HTTPS to origin
-                origin_ssl_protocols=["TLSv1.2"],
-                origin_keepalive_timeout=5,
-                origin_read_timeout=30
-            )
+            custom_origin_config=_ALB_CUSTOM_ORIGIN_CONFIG
         )
     
     def _create_cache_behavior(self, spec: CacheBehaviorSpec) -> cloudfront.DistributionOrderedCacheBehaviorArgs:
@@ -299,21 +314,20 @@ class CloudFrontComponent(BaseInfrastructureComponent):
         """
         # Note: Pulumi doesn't have a direct invalidation resource
         # This would need to be done via AWS CLI or SDK
-        pulumi.log.info(
-            f"To invalidate CloudFront cache, run: "
-            f"aws cloudfront create-invalidation --distribution-id {self.distribution.id} "
-            f"--paths {' '.join(paths)}"
+        command = pulumi.Output.concat(
+            "aws cloudfront create-invalidation --distribution-id ",
+            self.distribution.id,
+            " --paths ",
+            " ".join(paths)
+        )
+        command.apply(
+            lambda cmd: pulumi.log.info(f"To invalidate CloudFront cache, run: {cmd}")
         )
     
     def validate(self) -> None:
         """Validate CloudFront configuration."""
         # Validate price class
-        valid_price_classes = [
-            "PriceClass_All",
-            "PriceClass_100",
-            "PriceClass_200"
-        ]
-        if self.price_class not in valid_price_classes:
+        if self.price_class not in self._VALID_PRICE_CLASSES:
             raise ValueError(f"Invalid price class: {self.price_class}")
         
         # Validate domain aliases with certificate
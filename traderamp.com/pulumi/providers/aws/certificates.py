@@ -2,13 +2,17 @@
 AWS Certificate Manager components following clean code principles.
 """
 
+from __future__ import annotations
+
 from typing import Dict, Optional, Any, List
 import pulumi
 import pulumi_aws as aws
-from pulumi import ResourceOptions, Output
+from pulumi import Output
 
 from core.base_component import BaseInfrastructureComponent
 
+from .dns import _get_or_fetch_zone
+
 
 class CertificateComponent(BaseInfrastructureComponent):
     """
@@ -29,6 +33,11 @@ class CertificateComponent(BaseInfrastructureComponent):
         self.domain_name = domain_name
         self.include_www = include_www
         self.validation_method = validation_method
+        self._apex_domain = self._compute_apex(domain_name) if domain_name else None
+        
+        # Resource names
+        self._cert_name = f"{name}-cert"
+        self._validation_name = f"{name}-validation"
         
         super().__init__(
             "traderamp:aws:certificates:Certificate",
@@ -53,51 +62,51 @@ class CertificateComponent(BaseInfrastructureComponent):
         
         # Create certificate
         certificate = aws.acm.Certificate(
-            f"{self.name}-cert",
+            self._cert_name,
             domain_name=domain_names[0],
             subject_alternative_names=domain_names[1:] if len(domain_names) > 1 else [],
             validation_method=self.validation_method,
-            tags=self.get_tags("Certificate", f"{self.name}-cert"),
-            opts=ResourceOptions(parent=self)
+            tags=self.get_tags("Certificate", self._cert_name),
+            opts=self._opts
         )
         self.add_resource("certificate", certificate)
         
         # Handle DNS validation
         if self.validation_method == "DNS":
-            self._setup_dns_validation(certificate)
+            self._setup_dns_validation(certificate, domain_names)
     
-    def _setup_dns_validation(self, certificate: aws.acm.Certificate) -> None:
+    def _setup_dns_validation(
+        self,
+        certificate: aws.acm.Certificate,
+        domain_names: List[str]
+    ) -> None:
         """Set up DNS validation for the certificate."""
         try:
-            # Get hosted zone
-            hosted_zone = aws.route53.get_zone(
-                name=self._get_apex_domain(),
-                private_zone=False
-            )
+            # Get hosted zone (shared with the DNS component for the same apex)
+            hosted_zone = _get_or_fetch_zone(self._get_apex_domain())
             
             # Create validation records
             validation_records = []
-            for i in range(len([self.domain_name] + (
-                [f"www.{self.domain_name}"] if self.include_www else []
-            ))):
+            for i in range(len(domain_names)):
+                option = certificate.domain_validation_options[i]
                 record = aws.route53.Record(
-                    f"{self.name}-validation-{i}",
+                    f"{self._validation_name}-{i}",
                     zone_id=hosted_zone.id,
-                    name=certificate.domain_validation_options[i].resource_record_name,
-                    type=certificate.domain_validation_options[i].resource_record_type,
+                    name=option.resource_record_name,
+                    type=option.resource_record_type,
                     ttl=60,
-                    records=[certificate.domain_validation_options[i].resource_record_value],
+                    records=[option.resource_record_value],
                     allow_overwrite=True,
-                    opts=ResourceOptions(parent=self)
+                    opts=self._opts
                 )
                 validation_records.append(record)
             
             # Wait for validation
             validation = aws.acm.CertificateValidation(
-                f"{self.name}-validation",
+                self._validation_name,
                 certificate_arn=certificate.arn,
-                validation_record_fqdns=[r.fqdn for r in validation_records],
-                opts=ResourceOptions(parent=self, depends_on=validation_records)
+                validation_record_fqdns=Output.all(*(r.fqdn for r in validation_records)),
+                opts=self._opts_with_depends(validation_records)
             )
             self.add_resource("validation", validation)
             
@@ -109,11 +118,16 @@ class CertificateComponent(BaseInfrastructureComponent):
     
     def _get_apex_domain(self) -> str:
         """Get apex domain from full domain name."""
-        parts = self.domain_name.split(".")
+        return self._apex_domain
+    
+    @staticmethod
+    def _compute_apex(domain_name: str) -> str:
+        """Compute apex domain from a full domain name."""
+        parts = domain_name.split(".")
         if len(parts) > 2:
             # Handle subdomains
             return ".".join(parts[-2:])
-        return self.domain_name
+        return domain_name
     
     def get_outputs(self) -> Dict[str, Any]:
         """Get component outputs."""
@@ -2,17 +2,79 @@
 AWS Fargate compute components following clean code principles.
 """
 
+from __future__ import annotations
+
 from typing import Dict, List, Optional, Any
+from functools import lru_cache
 import json
 import pulumi
 import pulumi_aws as aws
-from pulumi import ResourceOptions, Output, Input
+from pulumi import Output, Input
 
 from core.base_component import BaseInfrastructureComponent
 from core.interfaces import ContainerSpec, ScalingSpec
 from core.validators import ValidationContext, RangeValidator
 
 
+# Trust policy shared by the task execution and task roles
+_ECS_TASKS_ASSUME_ROLE_POLICY = json.dumps(
+    {
+        "Version": "2012-10-17",
+        "Statement": [{
+            "Effect": "Allow",
+            "Principal": {"Service": "ecs-tasks.amazonaws.com"},
+            "Action": "sts:AssumeRole"
+        }]
+    },
+    separators=(",", ":")
+)
+
+# Placeholders for container definition fields that are only known once
+# their Outputs resolve, in the order they appear in the serialized JSON
+_IMAGE_SLOT = "\0image\0"
+_LOG_GROUP_SLOT = "\0log-group\0"
+_REGION_SLOT = "\0region\0"
+_CONTAINER_SLOTS = (_IMAGE_SLOT, _LOG_GROUP_SLOT, _REGION_SLOT)
+
+# Container definition fields shared by every service. Per-service keys are
+# listed with None so that merging overrides keeps the key order stable.
+_CONTAINER_DEF_TEMPLATE = {
+    "name": None,
+    "image": _IMAGE_SLOT,
+    "cpu": None,
+    "memory": None,
+    "essential": True,
+    "portMappings": None,
+    "environment": None,
+    "logConfiguration": {
+        "logDriver": "awslogs",
+        "options": {
+            "awslogs-group": _LOG_GROUP_SLOT,
+            "awslogs-region": _REGION_SLOT,
+            "awslogs-stream-prefix": "ecs"
+        }
+    },
+    "healthCheck": {
+        "command": ["CMD-SHELL", "curl -f http://localhost/health || exit 1"],
+        "interval": 30,
+        "timeout": 5,
+        "retries": 3,
+        "startPeriod": 60
+    }
+}
+
+
+@lru_cache(maxsize=1)
+def _region_name() -> Output[str]:
+    """
+    Get the provider region name, invoking the provider only once.
+    
+    Uses the Output form of the invoke so resource construction is not
+    blocked waiting on the RPC.
+    """
+    return aws.get_region_output().name
+
+
 class FargateServiceComponent(BaseInfrastructureComponent):
     """
     ECS Fargate service component.
@@ -67,14 +129,11 @@ class FargateServiceComponent(BaseInfrastructureComponent):
     
     def create_resources(self) -> None:
         """Create Fargate resources."""
-        # Create IAM roles
+        # Independent resources first, back to back, so Pulumi can register
+        # them concurrently: IAM roles, CloudWatch log group, ECS cluster
         execution_role = self._create_execution_role()
         task_role = self._create_task_role()
-        
-        # Create CloudWatch log group
         log_group = self._create_log_group()
-        
-        # Create ECS cluster
         cluster = self._create_cluster()
         
         # Create task definition
@@ -89,25 +148,20 @@ class FargateServiceComponent(BaseInfrastructureComponent):
         self._setup_auto_scaling(cluster, service)
         
         # Store key resources
-        self.add_resource("cluster", cluster)
-        self.add_resource("service", service)
-        self.add_resource("task_definition", task_definition)
-        self.add_resource("log_group", log_group)
+        self.add_resources({
+            "cluster": cluster,
+            "service": service,
+            "task_definition": task_definition,
+            "log_group": log_group
+        })
     
     def _create_execution_role(self) -> aws.iam.Role:
         """Create IAM role for task execution."""
         role = aws.iam.Role(
             f"{self.name}-execution-role",
-            assume_role_policy=json.dumps({
-                "Version": "2012-10-17",
-                "Statement": [{
-                    "Effect": "Allow",
-                    "Principal": {"Service": "ecs-tasks.amazonaws.com"},
-                    "Action": "sts:AssumeRole"
-                }]
-            }),
+            assume_role_policy=_ECS_TASKS_ASSUME_ROLE_POLICY,
             tags=self.get_tags("IAMRole", f"{self.name}-execution-role"),
-            opts=ResourceOptions(parent=self)
+            opts=self._opts
         )
         
         # Attach AWS managed policy
@@ -115,7 +169,7 @@ class FargateServiceComponent(BaseInfrastructureComponent):
             f"{self.name}-execution-policy",
             role=role.name,
             policy_arn="arn:aws:iam::aws:policy/service-role/AmazonECSTaskExecutionRolePolicy",
-            opts=ResourceOptions(parent=self)
+            opts=self._opts
         )
         
         return role
@@ -124,16 +178,9 @@ class FargateServiceComponent(BaseInfrastructureComponent):
         """Create IAM role for task containers."""
         return aws.iam.Role(
             f"{self.name}-task-role",
-            assume_role_policy=json.dumps({
-                "Version": "2012-10-17",
-                "Statement": [{
-                    "Effect": "Allow",
-                    "Principal": {"Service": "ecs-tasks.amazonaws.com"},
-                    "Action": "sts:AssumeRole"
-                }]
-            }),
+            assume_role_policy=_ECS_TASKS_ASSUME_ROLE_POLICY,
             tags=self.get_tags("IAMRole", f"{self.name}-task-role"),
-            opts=ResourceOptions(parent=self)
+            opts=self._opts
         )
     
     def _create_log_group(self) -> aws.cloudwatch.LogGroup:
@@ -143,7 +190,7 @@ class FargateServiceComponent(BaseInfrastructureComponent):
             name=f"/ecs/{self.name}",
             retention_in_days=self.log_retention_days,
             tags=self.get_tags("LogGroup", f"{self.name}-logs"),
-            opts=ResourceOptions(parent=self)
+            opts=self._opts
         )
     
     def _create_cluster(self) -> aws.ecs.Cluster:
@@ -160,7 +207,7 @@ class FargateServiceComponent(BaseInfrastructureComponent):
             name=self.name,
             settings=settings,
             tags=self.get_tags("ECSCluster", f"{self.name}-cluster"),
-            opts=ResourceOptions(parent=self)
+            opts=self._opts
         )
     
     def _create_task_definition(
@@ -170,40 +217,30 @@ class FargateServiceComponent(BaseInfrastructureComponent):
         log_group: aws.cloudwatch.LogGroup
     ) -> aws.ecs.TaskDefinition:
         """Create ECS task definition."""
-        # Prepare environment variables
-        environment = [
-            {"name": k, "value": v}
-            for k, v in self.container_spec.environment_variables.items()
-        ]
+        # Serialize the static JSON once and split it around the placeholders,
+        # so the apply below only has to encode the three resolved strings
+        static_json = json.dumps([self._container_template()], separators=(",", ":"))
+        segments = []
+        for slot in _CONTAINER_SLOTS:
+            head, static_json = static_json.split(json.dumps(slot), 1)
+            segments.append(head)
+        tail = static_json
         
-        # Container definition
-        container_def = {
-            "name": self.name,
-            "image": self.container_spec.image,
-            "cpu": self.container_spec.cpu_units,
-            "memory": self.container_spec.memory_mb,
-            "essential": True,
-            "portMappings": [{
-                "containerPort": self.container_spec.port,
-                "protocol": "tcp"
-            }],
-            "environment": environment,
-            "logConfiguration": {
-                "logDriver": "awslogs",
-                "options": {
-                    "awslogs-group": log_group.name,
-                    "awslogs-region": aws.get_region().name,
-                    "awslogs-stream-prefix": "ecs"
-                }
-            },
-            "healthCheck": {
-                "command": ["CMD-SHELL", "curl -f http://localhost/health || exit 1"],
-                "interval": 30,
-                "timeout": 5,
-                "retries": 3,
-                "startPeriod": 60
-            }
-        }
+        def render(values: List[str]) -> str:
+            parts = []
+            for head, value in zip(segments, values):
+                parts.append(head)
+                parts.append(json.dumps(value))
+            parts.append(tail)
+            return "".join(parts)
+        
+        # Only the image, log group name and region can be Outputs;
+        # resolve them in one apply
+        container_definitions = Output.all(
+            self.container_spec.image,
+            log_group.name,
+            _region_name()
+        ).apply(render)
         
         return aws.ecs.TaskDefinition(
             f"{self.name}-task",
@@ -214,11 +251,30 @@ class FargateServiceComponent(BaseInfrastructureComponent):
             memory=str(self.container_spec.memory_mb),
             execution_role_arn=execution_role.arn,
             task_role_arn=task_role.arn,
-            container_definitions=Output.json_dumps([container_def]),
+            container_definitions=container_definitions,
             tags=self.get_tags("TaskDefinition", f"{self.name}-task"),
-            opts=ResourceOptions(parent=self)
+            opts=self._opts
         )
     
+    def _container_template(self) -> Dict[str, Any]:
+        """
+        Build the container definition with placeholder slots.
+        
+        The image, log group name and region are left as _CONTAINER_SLOTS
+        placeholders and substituted once their Outputs resolve.
+        """
+        return {
+            **_CONTAINER_DEF_TEMPLATE,
+            "name": self.name,
+            "cpu": self.container_spec.cpu_units,
+            "memory": self.container_spec.memory_mb,
+            "portMappings": [{
+                "containerPort": self.container_spec.port,
+                "protocol": "tcp"
+            }],
+            "environment": self.container_spec.environment_list
+        }
+    
     def _create_service(
         self,
         cluster: aws.ecs.Cluster,
@@ -261,7 +317,7 @@ class FargateServiceComponent(BaseInfrastructureComponent):
         return aws.ecs.Service(
             f"{self.name}-service",
             **service_config,
-            opts=ResourceOptions(parent=self, depends_on=[task_definition])
+            opts=self._opts_with_depends([task_definition])
         )
     
     def register_with_target_group(self, target_group_arn: Input[str]) -> None:
@@ -293,46 +349,39 @@ class FargateServiceComponent(BaseInfrastructureComponent):
             ),
             scalable_dimension="ecs:service:DesiredCount",
             service_namespace="ecs",
-            opts=ResourceOptions(parent=self)
+            opts=self._opts
         )
         
-        # CPU scaling policy
-        aws.appautoscaling.Policy(
-            f"{self.name}-cpu-scaling",
-            name=f"{self.name}-cpu-scaling",
-            policy_type="TargetTrackingScaling",
-            resource_id=scaling_target.resource_id,
-            scalable_dimension=scaling_target.scalable_dimension,
-            service_namespace=scaling_target.service_namespace,
-            target_tracking_scaling_policy_configuration={
-                "predefined_metric_specification": {
-                    "predefined_metric_type": "ECSServiceAverageCPUUtilization"
-                },
-                "target_value": self.scaling_spec.target_cpu_percent,
-                "scale_in_cooldown": self.scaling_spec.scale_down_cooldown_seconds,
-                "scale_out_cooldown": self.scaling_spec.scale_up_cooldown_seconds
-            },
-            opts=ResourceOptions(parent=self)
-        )
+        # Settings shared by the CPU and memory target-tracking policies
+        cooldowns = {
+            "scale_in_cooldown": self.scaling_spec.scale_down_cooldown_seconds,
+            "scale_out_cooldown": self.scaling_spec.scale_up_cooldown_seconds
+        }
+        policy_kwargs = {
+            "policy_type": "TargetTrackingScaling",
+            "resource_id": scaling_target.resource_id,
+            "scalable_dimension": scaling_target.scalable_dimension,
+            "service_namespace": scaling_target.service_namespace,
+            "opts": self._opts
+        }
         
-        # Memory scaling policy
-        aws.appautoscaling.Policy(
-            f"{self.name}-memory-scaling",
-            name=f"{self.name}-memory-scaling",
-            policy_type="TargetTrackingScaling",
-            resource_id=scaling_target.resource_id,
-            scalable_dimension=scaling_target.scalable_dimension,
-            service_namespace=scaling_target.service_namespace,
-            target_tracking_scaling_policy_configuration={
-                "predefined_metric_specification": {
-                    "predefined_metric_type": "ECSServiceAverageMemoryUtilization"
+        # CPU and memory scaling policies
+        for metric, metric_type, target_value in (
+            ("cpu", "ECSServiceAverageCPUUtilization", self.scaling_spec.target_cpu_percent),
+            ("memory", "ECSServiceAverageMemoryUtilization", self.scaling_spec.target_memory_percent)
+        ):
+            aws.appautoscaling.Policy(
+                f"{self.name}-{metric}-scaling",
+                name=f"{self.name}-{metric}-scaling",
+                target_tracking_scaling_policy_configuration={
+                    "predefined_metric_specification": {
+                        "predefined_metric_type": metric_type
+                    },
+                    "target_value": target_value,
+                    **cooldowns
                 },
-                "target_value": self.scaling_spec.target_memory_percent,
-                "scale_in_cooldown": self.scaling_spec.scale_down_cooldown_seconds,
-                "scale_out_cooldown": self.scaling_spec.scale_up_cooldown_seconds
-            },
-            opts=ResourceOptions(parent=self)
-        )
+                **policy_kwargs
+            )
     
     def get_outputs(self) -> Dict[str, Any]:
         """Get component outputs."""
@@ -2,14 +2,57 @@
 AWS Route53 DNS components following clean code principles.
 """
 
+from __future__ import annotations
+
 from typing import Dict, Optional, Any
-import pulumi
 import pulumi_aws as aws
-from pulumi import ResourceOptions, Output, Input
+from pulumi import Output, Input
 
 from core.base_component import BaseInfrastructureComponent
 
 
+# Public hosted zones already looked up in this program, keyed by apex domain
+_ZONE_CACHE: Dict[str, aws.route53.GetZoneResult] = {}
+
+# Hosted zone IDs from non-blocking lookups, keyed by apex domain
+_ZONE_ID_CACHE: Dict[str, Output[str]] = {}
+
+
+def _get_or_fetch_zone(apex_domain: str) -> aws.route53.GetZoneResult:
+    """
+    Get the public hosted zone for an apex domain, fetching it at most once.
+    
+    Blocks on the lookup; for callers that must handle a missing zone on the spot.
+    """
+    zone = _ZONE_CACHE.get(apex_domain)
+    if zone is None:
+        zone = _ZONE_CACHE[apex_domain] = aws.route53.get_zone(
+            name=apex_domain,
+            private_zone=False
+        )
+    return zone
+
+
+def _get_zone_id_output(apex_domain: str) -> Output[str]:
+    """
+    Get the public hosted zone ID for an apex domain without blocking.
+    
+    Reuses a zone already fetched by _get_or_fetch_zone, otherwise issues one
+    non-blocking lookup per apex domain.
+    """
+    zone = _ZONE_CACHE.get(apex_domain)
+    if zone is not None:
+        return Output.from_input(zone.id)
+    
+    zone_id = _ZONE_ID_CACHE.get(apex_domain)
+    if zone_id is None:
+        zone_id = _ZONE_ID_CACHE[apex_domain] = aws.route53.get_zone_output(
+            name=apex_domain,
+            private_zone=False
+        ).id
+    return zone_id
+
+
 class DNSComponent(BaseInfrastructureComponent):
     """
     Route53 DNS component.
@@ -29,7 +72,8 @@ class DNSComponent(BaseInfrastructureComponent):
         self.domain_name = domain_name
         self.create_apex_record = create_apex_record
         self.create_www_record = create_www_record
-        self.hosted_zone = None
+        self.hosted_zone_id: Optional[Output[str]] = None
+        self._apex_domain = self._compute_apex(domain_name) if domain_name else None
         
         super().__init__(
             "traderamp:aws:dns:DNS",
@@ -44,19 +88,10 @@ class DNSComponent(BaseInfrastructureComponent):
     
     def create_resources(self) -> None:
         """Create DNS resources."""
-        try:
-            # Get hosted zone
-            self.hosted_zone = aws.route53.get_zone(
-                name=self._get_apex_domain(),
-                private_zone=False
-            )
-            self.add_resource("hosted_zone_id", self.hosted_zone.id)
-            
-        except Exception as e:
-            pulumi.log.error(
-                f"Could not find Route53 hosted zone for {self.domain_name}: {e}"
-            )
-            raise
+        # Look up the hosted zone without blocking; a missing zone fails
+        # the deployment when the lookup resolves
+        self.hosted_zone_id = _get_zone_id_output(self._get_apex_domain())
+        self.add_resource("hosted_zone_id", self.hosted_zone_id)
     
     def create_alias_record(
         self,
@@ -75,12 +110,9 @@ class DNSComponent(BaseInfrastructureComponent):
             alias_zone_id: Target resource zone ID
             record_type: Record type (A or AAAA)
         """
-        if not self.hosted_zone:
-            raise ValueError("No hosted zone available")
-        
         record = aws.route53.Record(
             f"{self.name}-{record_name.replace('.', '-')}",
-            zone_id=self.hosted_zone.id,
+            zone_id=self.hosted_zone_id,
             name=record_name,
             type=record_type,
             aliases=[{
@@ -88,7 +120,7 @@ class DNSComponent(BaseInfrastructureComponent):
                 "zone_id": alias_zone_id,
                 "evaluate_target_health": True
             }],
-            opts=ResourceOptions(parent=self)
+            opts=self._opts
         )
         
         self.add_resource(f"record-{record_name}", record)
@@ -108,17 +140,14 @@ class DNSComponent(BaseInfrastructureComponent):
             target: Target hostname
             ttl: Time to live in seconds
         """
-        if not self.hosted_zone:
-            raise ValueError("No hosted zone available")
-        
         record = aws.route53.Record(
             f"{self.name}-{record_name.replace('.', '-')}",
-            zone_id=self.hosted_zone.id,
+            zone_id=self.hosted_zone_id,
             name=record_name,
             type="CNAME",
             ttl=ttl,
             records=[target],
-            opts=ResourceOptions(parent=self)
+            opts=self._opts
         )
         
         self.add_resource(f"record-{record_name}", record)
@@ -126,23 +155,26 @@ class DNSComponent(BaseInfrastructureComponent):
     
     def _get_apex_domain(self) -> str:
         """Get apex domain from full domain name."""
-        parts = self.domain_name.split(".")
-        if len(parts) > 2 and parts[0] == "www":
+        return self._apex_domain
+    
+    @staticmethod
+    def _compute_apex(domain_name: str) -> str:
+        """Compute apex domain from a full domain name."""
+        if domain_name.startswith("www.") and domain_name.count(".") > 1:
             # Remove www prefix
-            return ".".join(parts[1:])
-        elif len(parts) > 2:
+            return domain_name[4:]
+        
+        # rsplit stops after the last two dots
+        parts = domain_name.rsplit(".", 2)
+        if len(parts) > 2:
             # Handle other subdomains
-            return ".".join(parts[-2:])
-        return self.domain_name
+            return f"{parts[1]}.{parts[2]}"
+        return domain_name
     
     def get_outputs(self) -> Dict[str, Any]:
         """Get component outputs."""
-        outputs = {
+        return {
             "domain_name": self.domain_name,
-            "apex_domain": self._get_apex_domain()
-        }
-        
-        if self.hosted_zone:
-            outputs["hosted_zone_id"] = self.hosted_zone.id
-        
-        return outputs
\ No newline at end of file
+            "apex_domain": self._get_apex_domain(),
+            "hosted_zone_id": self.hosted_zone_id
+        }
\ No newline at end of file
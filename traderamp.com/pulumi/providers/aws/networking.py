@@ -4,15 +4,54 @@ AWS implementation of networking components.
 Follows Interface Segregation and Dependency Inversion principles.
 """
 
-from typing import List, Dict, Optional, Any
-import pulumi
+from __future__ import annotations
+
+from typing import List, Dict, Any, Sequence, Union
+import ipaddress
+import itertools
+import json
 import pulumi_aws as aws
-from pulumi import ResourceOptions, Output
+from pulumi import Alias, Output, ResourceOptions
 
 from core.base_component import BaseInfrastructureComponent
 from core.interfaces import INetworkProvider, HealthCheckSpec
 from core.validators import RangeValidator, ListLengthValidator, ValidationContext
 
+from ._az_table import get_static_availability_zones
+from ._cache import get_availability_zones
+
+
+# IAM documents for the VPC flow-log role, serialized once at import
+_FLOW_LOG_ASSUME_ROLE_POLICY = json.dumps(
+    {
+        "Version": "2012-10-17",
+        "Statement": [{
+            "Effect": "Allow",
+            "Principal": {"Service": "vpc-flow-logs.amazonaws.com"},
+            "Action": "sts:AssumeRole"
+        }]
+    },
+    separators=(",", ":")
+)
+
+_FLOW_LOG_POLICY = json.dumps(
+    {
+        "Version": "2012-10-17",
+        "Statement": [{
+            "Effect": "Allow",
+            "Action": [
+                "logs:CreateLogGroup",
+                "logs:CreateLogStream",
+                "logs:PutLogEvents",
+                "logs:DescribeLogGroups",
+                "logs:DescribeLogStreams"
+            ],
+            "Resource": "*"
+        }]
+    },
+    separators=(",", ":")
+)
+
 
 class AWSNetworkProvider(INetworkProvider):
     """AWS implementation of network provider."""
@@ -84,50 +123,115 @@ class VPCComponent(BaseInfrastructureComponent):
             enable_dns_hostnames=True,
             enable_dns_support=True,
             tags=self.get_tags("VPC", f"{self.name}-vpc"),
-            opts=ResourceOptions(parent=self)
+            opts=self._opts
         )
-        self.add_resource("vpc", vpc)
+        # Collected locally and registered in one go at the end
+        resources: Dict[str, Any] = {"vpc": vpc}
         
-        # Create Internet Gateway
+        # The IGW, subnets and flow logs only depend on vpc.id, not on each
+        # other, so none of them carries a depends_on and the engine can
+        # create them side by side
         igw = aws.ec2.InternetGateway(
             f"{self.name}-igw",
             vpc_id=vpc.id,
             tags=self.get_tags("InternetGateway", f"{self.name}-igw"),
-            opts=ResourceOptions(parent=self)
+            opts=self._opts
         )
-        self.add_resource("igw", igw)
-        
-        # Create subnets
-        self._create_subnets(vpc)
+        resources["igw"] = igw
         
-        # Create route table
-        self._create_route_table(vpc, igw)
+        subnets = self._create_subnets(vpc)
+        for i, subnet in enumerate(subnets):
+            resources[f"subnet-{i+1}"] = subnet
+        resources["subnets"] = subnets
         
-        # Optionally create flow logs
         if self.enable_flow_logs:
-            self._create_flow_logs(vpc)
+            resources["flow_log"] = self._create_flow_logs(vpc)
+        
+        # The route table is the join point: it needs the IGW, and its
+        # associations need the subnets
+        resources["route_table"] = self._create_route_table(vpc, igw, subnets)
+        
+        self.add_resources(resources)
+        
+        # Built once here so get_outputs does not re-walk the subnets
+        self._outputs = {
+            "vpc_id": vpc.id,
+            "vpc_cidr": vpc.cidr_block,
+            # Kept as a list of Outputs rather than one Output.all(...): consumers
+            # such as LoadBalancerComponent validate its length up front
+            "subnet_ids": [s.id for s in subnets],
+            "subnet_count": len(subnets)
+        }
     
-    def _create_subnets(self, vpc: aws.ec2.Vpc) -> None:
+    def _create_subnets(self, vpc: aws.ec2.Vpc) -> List[aws.ec2.Subnet]:
         """Create public subnets."""
-        azs = aws.get_availability_zones(state="available")
+        az_names = self._availability_zone_names()
+        subnet_cidrs = self._subnet_cidrs()
         
         subnets = []
-        for i in range(min(self.availability_zone_count, len(azs.names))):
+        for i in range(self.availability_zone_count):
             subnet = aws.ec2.Subnet(
                 f"{self.name}-subnet-{i+1}",
                 vpc_id=vpc.id,
-                cidr_block=f"10.0.{i+1}.0/24",
-                availability_zone=azs.names[i],
+                cidr_block=subnet_cidrs[i],
+                availability_zone=self._subnet_availability_zone(az_names, i),
                 map_public_ip_on_launch=True,
                 tags=self.get_tags("Subnet", f"{self.name}-subnet-{i+1}"),
-                opts=ResourceOptions(parent=self)
+                opts=self._opts
             )
             subnets.append(subnet)
-            self.add_resource(f"subnet-{i+1}", subnet)
         
-        self.add_resource("subnets", subnets)
+        return subnets
+    
+    def _subnet_cidrs(self) -> List[str]:
+        """Carve one /24 per availability zone out of the VPC CIDR block."""
+        # The first /24 is left unused, so the default VPC keeps 10.0.1.0/24 onwards
+        blocks = ipaddress.ip_network(self.cidr_block).subnets(new_prefix=24)
+        cidrs = [
+            str(block)
+            for block in itertools.islice(blocks, 1, self.availability_zone_count + 1)
+        ]
+        if len(cidrs) < self.availability_zone_count:
+            raise ValueError(
+                f"VPC CIDR {self.cidr_block} is too small for "
+                f"{self.availability_zone_count} /24 subnets"
+            )
+        return cidrs
     
-    def _create_route_table(self, vpc: aws.ec2.Vpc, igw: aws.ec2.InternetGateway) -> None:
+    def _availability_zone_names(self) -> Union[Sequence[str], Output[List[str]]]:
+        """Get availability zone names, preferring the static region table."""
+        static_names = get_static_availability_zones()
+        if static_names is not None:
+            return static_names
+        
+        # Resolved by the engine concurrently with VPC/IGW registration
+        return get_availability_zones(state="available").names
+    
+    def _subnet_availability_zone(
+        self,
+        az_names: Union[Sequence[str], Output[List[str]]],
+        index: int
+    ) -> Union[str, Output[str]]:
+        """Get the availability zone for a subnet from known or looked-up names."""
+        if isinstance(az_names, Output):
+            return az_names.apply(lambda names: self._pick_availability_zone(names, index))
+        return self._pick_availability_zone(az_names, index)
+    
+    def _pick_availability_zone(self, names: List[str], index: int) -> str:
+        """Get the availability zone for a subnet index."""
+        if index >= len(names):
+            raise ValueError(
+                f"availability_zone_count is {self.availability_zone_count} but "
+                f"only {len(names)} availability zones are available"
+            )
+        return names[index]
+    
+    def _create_route_table(
+        self,
+        vpc: aws.ec2.Vpc,
+        igw: aws.ec2.InternetGateway,
+        subnets: List[aws.ec2.Subnet]
+    ) -> aws.ec2.RouteTable:
         """Create and associate route table."""
         route_table = aws.ec2.RouteTable(
             f"{self.name}-rt",
@@ -137,21 +241,23 @@ class VPCComponent(BaseInfrastructureComponent):
                 "gateway_id": igw.id
             }],
             tags=self.get_tags("RouteTable", f"{self.name}-rt"),
-            opts=ResourceOptions(parent=self)
+            opts=self._opts
         )
-        self.add_resource("route_table", route_table)
         
-        # Associate with subnets
-        subnets = self.get_resource("subnets")
+        # Associate with subnets, grouped under the route table they belong to;
+        # the alias keeps associations created under the component in place
+        rta_opts = ResourceOptions(parent=route_table, aliases=[Alias(parent=self)])
         for i, subnet in enumerate(subnets):
             aws.ec2.RouteTableAssociation(
                 f"{self.name}-rta-{i+1}",
                 subnet_id=subnet.id,
                 route_table_id=route_table.id,
-                opts=ResourceOptions(parent=self)
+                opts=rta_opts
             )
+        
+        return route_table
     
-    def _create_flow_logs(self, vpc: aws.ec2.Vpc) -> None:
+    def _create_flow_logs(self, vpc: aws.ec2.Vpc) -> aws.ec2.FlowLog:
         """Create VPC flow logs."""
         # Create log group
         log_group = aws.cloudwatch.LogGroup(
@@ -159,7 +265,7 @@ class VPCComponent(BaseInfrastructureComponent):
             name=f"/aws/vpc/{self.name}",
             retention_in_days=7,
             tags=self.get_tags("LogGroup", f"{self.name}-flow-logs"),
-            opts=ResourceOptions(parent=self)
+            opts=self._opts
         )
         
         # Create IAM role for flow logs
@@ -174,60 +280,30 @@ class VPCComponent(BaseInfrastructureComponent):
             traffic_type="ALL",
             vpc_id=vpc.id,
             tags=self.get_tags("FlowLog", f"{self.name}-flow-log"),
-            opts=ResourceOptions(parent=self)
+            opts=self._opts
         )
-        self.add_resource("flow_log", flow_log)
+        
+        return flow_log
     
     def _create_flow_log_role(self) -> aws.iam.Role:
         """Create IAM role for flow logs."""
         role = aws.iam.Role(
             f"{self.name}-flow-log-role",
-            assume_role_policy="""{
-                "Version": "2012-10-17",
-                "Statement": [{
-                    "Effect": "Allow",
-                    "Principal": {"Service": "vpc-flow-logs.amazonaws.com"},
-                    "Action": "sts:AssumeRole"
-                }]
-            }""",
+            assume_role_policy=_FLOW_LOG_ASSUME_ROLE_POLICY,
+            # Policy is declared inline so the role is a single resource
+            inline_policies=[{
+                "name": f"{self.name}-flow-log-policy",
+                "policy": _FLOW_LOG_POLICY
+            }],
             tags=self.get_tags("IAMRole", f"{self.name}-flow-log-role"),
-            opts=ResourceOptions(parent=self)
-        )
-        
-        # Attach policy
-        aws.iam.RolePolicy(
-            f"{self.name}-flow-log-policy",
-            role=role.id,
-            policy="""{
-                "Version": "2012-10-17",
-                "Statement": [{
-                    "Effect": "Allow",
-                    "Action": [
-                        "logs:CreateLogGroup",
-                        "logs:CreateLogStream",
-                        "logs:PutLogEvents",
-                        "logs:DescribeLogGroups",
-                        "logs:DescribeLogStreams"
-                    ],
-                    "Resource": "*"
-                }]
-            }""",
-            opts=ResourceOptions(parent=self)
+            opts=self._opts
         )
         
         return role
     
     def get_outputs(self) -> Dict[str, Any]:
         """Get component outputs."""
-        vpc = self.get_resource("vpc")
-        subnets = self.get_resource("subnets")
-        
-        return {
-            "vpc_id": vpc.id,
-            "vpc_cidr": vpc.cidr_block,
-            "subnet_ids": [s.id for s in subnets],
-            "subnet_count": len(subnets)
-        }
+        return self._outputs
 
 
 class LoadBalancerComponent(BaseInfrastructureComponent):
@@ -238,6 +314,14 @@ class LoadBalancerComponent(BaseInfrastructureComponent):
     Certificate management is delegated to a separate component.
     """
     
+    # Target group health-check settings that do not depend on HealthCheckSpec
+    _STATIC_HC = {
+        "enabled": True,
+        "protocol": "HTTP",
+        "port": "traffic-port",
+        "matcher": "200-299"
+    }
+    
     def __init__(
         self,
         name: str,
@@ -255,6 +339,16 @@ class LoadBalancerComponent(BaseInfrastructureComponent):
         self.health_check = health_check
         self.enable_deletion_protection = enable_deletion_protection
         
+        # Target group health check, built once and reused by every target group
+        self._health_check_block = {
+            **self._STATIC_HC,
+            "path": health_check.path,
+            "interval": health_check.interval_seconds,
+            "timeout": health_check.timeout_seconds,
+            "healthy_threshold": health_check.healthy_threshold,
+            "unhealthy_threshold": health_check.unhealthy_threshold
+        }
+        
         super().__init__(
             "traderamp:aws:networking:LoadBalancer",
             name,
@@ -288,7 +382,7 @@ class LoadBalancerComponent(BaseInfrastructureComponent):
             enable_http2=True,
             idle_timeout=60,
             tags=self.get_tags("ALB", f"{self.name}-alb"),
-            opts=ResourceOptions(parent=self)
+            opts=self._opts
         )
         self.add_resource("alb", alb)
         
@@ -299,6 +393,13 @@ class LoadBalancerComponent(BaseInfrastructureComponent):
         # Create HTTP listener (redirect to HTTPS)
         http_listener = self._create_http_listener(alb)
         self.add_resource("http_listener", http_listener)
+        
+        self._outputs = {
+            "alb_arn": alb.arn,
+            "alb_dns_name": alb.dns_name,
+            "alb_zone_id": alb.zone_id,
+            "target_group_arn": target_group.arn
+        }
     
     def _create_target_group(self) -> aws.lb.TargetGroup:
         """Create target group with health checks."""
@@ -309,19 +410,9 @@ class LoadBalancerComponent(BaseInfrastructureComponent):
             vpc_id=self.vpc_id,
             target_type="ip",  # For Fargate
             deregistration_delay=30,
-            health_check={
-                "enabled": True,
-                "path": self.health_check.path,
-                "protocol": "HTTP",
-                "port": "traffic-port",
-                "interval": self.health_check.interval_seconds,
-                "timeout": self.health_check.timeout_seconds,
-                "healthy_threshold": self.health_check.healthy_threshold,
-                "unhealthy_threshold": self.health_check.unhealthy_threshold,
-                "matcher": "200-299"
-            },
+            health_check=self._health_check_block,
             tags=self.get_tags("TargetGroup", f"{self.name}-tg"),
-            opts=ResourceOptions(parent=self)
+            opts=self._opts
         )
     
     def _create_http_listener(self, alb: aws.lb.LoadBalancer) -> aws.lb.Listener:
@@ -336,7 +427,7 @@ class LoadBalancerComponent(BaseInfrastructureComponent):
                 "type": "forward",
                 "target_group_arn": target_group.arn
             }],
-            opts=ResourceOptions(parent=self)
+            opts=self._opts
         )
     
     def create_https_listener(
@@ -363,7 +454,7 @@ class LoadBalancerComponent(BaseInfrastructureComponent):
                 "type": "forward",
                 "target_group_arn": target_group.arn
             }],
-            opts=ResourceOptions(parent=self)
+            opts=self._opts
         )
         
         self.add_resource("https_listener", https_listener)
@@ -371,15 +462,7 @@ class LoadBalancerComponent(BaseInfrastructureComponent):
     
     def get_outputs(self) -> Dict[str, Any]:
         """Get component outputs."""
-        alb = self.get_resource("alb")
-        target_group = self.get_resource("target_group")
-        
-        return {
-            "alb_arn": alb.arn,
-            "alb_dns_name": alb.dns_name,
-            "alb_zone_id": alb.zone_id,
-            "target_group_arn": target_group.arn
-        }
+        return self._outputs
     
     @property
     def target_group_arn(self) -> Output[str]:
@@ -2,24 +2,33 @@
 AWS Security Group components following clean code principles.
 """
 
-from typing import List, Dict, Optional, Any
-import pulumi
+from __future__ import annotations
+
+from typing import Dict, Optional, Any, Sequence, Tuple
 import pulumi_aws as aws
-from pulumi import ResourceOptions, Output, Input
+from pulumi import Input
 
 from core.base_component import BaseInfrastructureComponent
-from core.validators import ValidationContext, ListLengthValidator
 
 
 class SecurityRule:
     """Represents a security group rule."""
     
+    __slots__ = (
+        "protocol",
+        "from_port",
+        "to_port",
+        "cidr_blocks",
+        "source_security_group_id",
+        "description"
+    )
+    
     def __init__(
         self,
         protocol: str,
         from_port: int,
         to_port: int,
-        cidr_blocks: Optional[List[str]] = None,
+        cidr_blocks: Optional[Sequence[str]] = None,
         source_security_group_id: Optional[Input[str]] = None,
         description: str = ""
     ):
@@ -32,6 +41,26 @@ class SecurityRule:
         self.description = description
 
 
+# Immutable rule inputs shared by every group built in this module
+_ALL_CIDRS = ("0.0.0.0/0",)
+
+# ALB accepts HTTP/HTTPS from anywhere
+_ALB_INGRESS_RULES = (
+    SecurityRule("tcp", 80, 80, _ALL_CIDRS, description="Allow HTTP"),
+    SecurityRule("tcp", 443, 443, _ALL_CIDRS, description="Allow HTTPS")
+)
+
+# ALB needs to reach anywhere for health checks
+_ALB_EGRESS_RULES = (
+    SecurityRule("tcp", 80, 80, _ALL_CIDRS, description="Allow HTTP outbound"),
+)
+
+# Used when a group is given no egress rules
+_DEFAULT_EGRESS_RULES = (
+    SecurityRule("-1", 0, 0, _ALL_CIDRS, description="Allow all outbound"),
+)
+
+
 class SecurityGroupComponent(BaseInfrastructureComponent):
     """
     Security group component with clean separation of concerns.
@@ -42,8 +71,8 @@ class SecurityGroupComponent(BaseInfrastructureComponent):
         name: str,
         vpc_id: Input[str],
         description: str,
-        ingress_rules: List[SecurityRule] = None,
-        egress_rules: List[SecurityRule] = None,
+        ingress_rules: Sequence[SecurityRule] = None,
+        egress_rules: Sequence[SecurityRule] = None,
         **kwargs
     ):
         """Initialize security group component."""
@@ -65,61 +94,42 @@ class SecurityGroupComponent(BaseInfrastructureComponent):
     
     def create_resources(self) -> None:
         """Create security group resources."""
-        # Create security group
+        egress_rules = self.egress_rules or _DEFAULT_EGRESS_RULES
+        
+        # Create security group with its rules inline
         sg = aws.ec2.SecurityGroup(
             f"{self.name}-sg",
             vpc_id=self.vpc_id,
             description=self.description,
+            ingress=[self._to_inline_rule(rule) for rule in self.ingress_rules],
+            egress=[self._to_inline_rule(rule) for rule in egress_rules],
             tags=self.get_tags("SecurityGroup", f"{self.name}-sg"),
-            opts=ResourceOptions(parent=self)
+            opts=self._opts
         )
         self.add_resource("security_group", sg)
         
-        # Create ingress rules
-        for i, rule in enumerate(self.ingress_rules):
-            self._create_rule(f"ingress-{i}", rule, "ingress", sg.id)
-        
-        # Create egress rules
-        if not self.egress_rules:
-            # Default: allow all outbound
-            self._create_rule(
-                "egress-default",
-                SecurityRule("all", 0, 65535, ["0.0.0.0/0"], description="Allow all outbound"),
-                "egress",
-                sg.id
-            )
-        else:
-            for i, rule in enumerate(self.egress_rules):
-                self._create_rule(f"egress-{i}", rule, "egress", sg.id)
+        self._outputs = {
+            "security_group_id": sg.id,
+            "security_group_name": sg.name
+        }
     
-    def _create_rule(
-        self,
-        name: str,
-        rule: SecurityRule,
-        rule_type: str,
-        security_group_id: Input[str]
-    ) -> None:
-        """Create a security group rule."""
-        aws.ec2.SecurityGroupRule(
-            f"{self.name}-{name}",
-            type=rule_type,
-            security_group_id=security_group_id,
-            protocol=rule.protocol,
-            from_port=rule.from_port,
-            to_port=rule.to_port,
-            cidr_blocks=rule.cidr_blocks,
-            source_security_group_id=rule.source_security_group_id,
-            description=rule.description,
-            opts=ResourceOptions(parent=self)
-        )
+    @staticmethod
+    def _to_inline_rule(rule: SecurityRule) -> Dict[str, Any]:
+        """Convert a security rule to an inline ingress/egress block."""
+        return {
+            "protocol": rule.protocol,
+            "from_port": rule.from_port,
+            "to_port": rule.to_port,
+            "cidr_blocks": rule.cidr_blocks or (),
+            "security_groups": (
+                [rule.source_security_group_id] if rule.source_security_group_id else []
+            ),
+            "description": rule.description
+        }
     
     def get_outputs(self) -> Dict[str, Any]:
         """Get component outputs."""
-        sg = self.get_resource("security_group")
-        return {
-            "security_group_id": sg.id,
-            "security_group_name": sg.name
-        }
+        return self._outputs
 
 
 class SecurityGroupFactory:
@@ -129,27 +139,24 @@ class SecurityGroupFactory:
         """Initialize security group factory."""
         self.vpc_id = vpc_id
         self.tagger = tagger
+        # Groups already built by this factory, keyed by (kind, name)
+        self._cache: Dict[Tuple[str, str], SecurityGroupComponent] = {}
     
     def create_alb_security_group(self, name: str) -> SecurityGroupComponent:
         """Create security group for Application Load Balancer."""
-        ingress_rules = [
-            SecurityRule("tcp", 80, 80, ["0.0.0.0/0"], description="Allow HTTP"),
-            SecurityRule("tcp", 443, 443, ["0.0.0.0/0"], description="Allow HTTPS")
-        ]
+        key = ("alb", name)
+        if key in self._cache:
+            return self._cache[key]
         
-        # ALB needs to reach anywhere for health checks
-        egress_rules = [
-            SecurityRule("tcp", 80, 80, ["0.0.0.0/0"], description="Allow HTTP outbound")
-        ]
-        
-        return SecurityGroupComponent(
+        self._cache[key] = SecurityGroupComponent(
             name=name,
             vpc_id=self.vpc_id,
             description="Security group for Application Load Balancer",
-            ingress_rules=ingress_rules,
-            egress_rules=egress_rules,
+            ingress_rules=_ALB_INGRESS_RULES,
+            egress_rules=_ALB_EGRESS_RULES,
             tagger=self.tagger
         )
+        return self._cache[key]
     
     def create_ecs_security_group(
         self,
@@ -157,22 +164,27 @@ class SecurityGroupFactory:
         alb_security_group_id: Input[str]
     ) -> SecurityGroupComponent:
         """Create security group for ECS tasks."""
-        ingress_rules = [
+        key = ("ecs", name)
+        if key in self._cache:
+            return self._cache[key]
+        
+        ingress_rules = (
             SecurityRule(
                 "tcp", 80, 80,
                 source_security_group_id=alb_security_group_id,
                 description="Allow traffic from ALB"
-            )
-        ]
+            ),
+        )
         
         # ECS tasks need outbound access for image pulls and external APIs
         egress_rules = None  # Use default (allow all)
         
-        return SecurityGroupComponent(
+        self._cache[key] = SecurityGroupComponent(
             name=name,
             vpc_id=self.vpc_id,
             description="Security group for ECS tasks",
             ingress_rules=ingress_rules,
             egress_rules=egress_rules,
             tagger=self.tagger
-        )
\ No newline at end of file
+        )
+        return self._cache[key]
\ No newline at end of file
@@ -2,16 +2,94 @@
 AWS storage components following clean code principles.
 """
 
-from typing import Dict, Optional, Any, List
+from __future__ import annotations
+
+from typing import Dict, Any
 import json
-import pulumi
 import pulumi_aws as aws
-from pulumi import ResourceOptions, Output
 
 from core.base_component import BaseInfrastructureComponent
 from core.validators import ValidationContext, RangeValidator
 
 
+# Tag prefixes for release and development images
+_RELEASE_PREFIXES = ("v", "latest", "main", "master")
+_DEV_PREFIXES = ("dev-", "feature-", "test-")
+
+# Lifecycle rule for short-lived development images; has no per-repository fields
+_DEV_IMAGES_RULE = {
+    "rulePriority": 3,
+    "description": "Remove old development images",
+    "selection": {
+        "tagStatus": "tagged",
+        "tagPrefixList": _DEV_PREFIXES,
+        "countType": "sinceImagePushed",
+        "countUnit": "days",
+        "countNumber": 3
+    },
+    "action": {"type": "expire"}
+}
+
+# Placeholders for the per-repository retention settings
+_MAX_IMAGES_SLOT = "\0max_image_count\0"
+_UNTAGGED_DAYS_SLOT = "\0untagged_image_days\0"
+
+
+def _lifecycle_policy_template(include_dev_rule: bool) -> str:
+    """
+    Build a lifecycle policy document with %-format fields for the settings.
+    
+    Args:
+        include_dev_rule: Whether to append the development image rule
+        
+    Returns:
+        Compact JSON to be formatted with max_image_count and untagged_image_days
+    """
+    rules = [
+        {
+            "rulePriority": 1,
+            "description": f"Keep last {_MAX_IMAGES_SLOT} tagged images",
+            "selection": {
+                "tagStatus": "tagged",
+                "tagPrefixList": _RELEASE_PREFIXES,
+                "countType": "imageCountMoreThan",
+                "countNumber": _MAX_IMAGES_SLOT
+            },
+            "action": {"type": "expire"}
+        },
+        {
+            "rulePriority": 2,
+            "description": f"Remove untagged images after {_UNTAGGED_DAYS_SLOT} days",
+            "selection": {
+                "tagStatus": "untagged",
+                "countType": "sinceImagePushed",
+                "countUnit": "days",
+                "countNumber": _UNTAGGED_DAYS_SLOT
+            },
+            "action": {"type": "expire"}
+        }
+    ]
+    if include_dev_rule:
+        rules.append(_DEV_IMAGES_RULE)
+    
+    template = json.dumps({"rules": rules}, separators=(",", ":")).replace("%", "%%")
+    for slot, field in (
+        (_MAX_IMAGES_SLOT, "%(max_image_count)d"),
+        (_UNTAGGED_DAYS_SLOT, "%(untagged_image_days)d")
+    ):
+        quoted = json.dumps(slot)
+        # countNumber takes the bare number; descriptions embed it in text
+        template = template.replace(quoted, field).replace(quoted[1:-1], field)
+    return template
+
+
+# Development images are only pruned separately when keeping more than 5
+_LIFECYCLE_POLICY_TEMPLATES = {
+    include_dev_rule: _lifecycle_policy_template(include_dev_rule)
+    for include_dev_rule in (False, True)
+}
+
+
 class ContainerRegistryComponent(BaseInfrastructureComponent):
     """
     ECR (Elastic Container Registry) component.
@@ -75,68 +153,38 @@ class ContainerRegistryComponent(BaseInfrastructureComponent):
                 "encryption_type": "AES256"
             }],
             tags=self.get_tags("ECR", f"{self.name}-ecr"),
-            opts=ResourceOptions(parent=self)
+            opts=self._opts
         )
-        self.add_resource("repository", repository)
         
         # Create lifecycle policy
         lifecycle_policy = self._create_lifecycle_policy(repository)
-        self.add_resource("lifecycle_policy", lifecycle_policy)
+        
+        self.add_resources({
+            "repository": repository,
+            "lifecycle_policy": lifecycle_policy
+        })
+        
+        self._outputs = {
+            "repository_arn": repository.arn,
+            "repository_url": repository.repository_url,
+            "repository_name": repository.name
+        }
     
     def _create_lifecycle_policy(self, repository: aws.ecr.Repository) -> aws.ecr.LifecyclePolicy:
         """Create lifecycle policy for image cleanup."""
-        rules = [
-            {
-                "rulePriority": 1,
-                "description": f"Keep last {self.max_image_count} tagged images",
-                "selection": {
-                    "tagStatus": "tagged",
-                    "tagPrefixList": ["v", "latest", "main", "master"],
-                    "countType": "imageCountMoreThan",
-                    "countNumber": self.max_image_count
-                },
-                "action": {"type": "expire"}
-            },
-            {
-                "rulePriority": 2,
-                "description": f"Remove untagged images after {self.untagged_image_days} days",
-                "selection": {
-                    "tagStatus": "untagged",
-                    "countType": "sinceImagePushed",
-                    "countUnit": "days",
-                    "countNumber": self.untagged_image_days
-                },
-                "action": {"type": "expire"}
-            }
-        ]
-        
-        # Add rule for development images
-        if self.max_image_count > 5:
-            rules.append({
-                "rulePriority": 3,
-                "description": "Remove old development images",
-                "selection": {
-                    "tagStatus": "tagged",
-                    "tagPrefixList": ["dev-", "feature-", "test-"],
-                    "countType": "sinceImagePushed",
-                    "countUnit": "days",
-                    "countNumber": 3
-                },
-                "action": {"type": "expire"}
-            })
+        template = _LIFECYCLE_POLICY_TEMPLATES[self.max_image_count > 5]
+        policy = template % {
+            "max_image_count": self.max_image_count,
+            "untagged_image_days": self.untagged_image_days
+        }
         
         return aws.ecr.LifecyclePolicy(
             f"{self.name}-lifecycle",
             repository=repository.name,
-            policy=json.dumps({"rules": rules}),
-            opts=ResourceOptions(parent=self)
+            policy=policy,
+            opts=self._opts
         )
     
     def get_outputs(self) -> Dict[str, Any]:
         """Get component outputs."""
-        repository = self.get_resource("repository")
-        return {
-            "repository_arn": repository.arn,
-            "repository_url": repository.repository_url,
-            "repository_name": repository.name
-        }
\ No newline at end of file
+        return self._outputs
\ No newline at end of file
@@ -0,0 +1,100 @@
+"""
+Validate checked-in Pulumi stack configuration without running Pulumi.
+
+Loads each Pulumi.<stack>.yaml next to Pulumi.yaml into a
+TradeRampConfiguration and runs its validation, so bad values fail at commit
+time instead of on `pulumi preview`. Run from anywhere, e.g. from the
+repository root as the pre-commit hook does:
+
+    python traderamp.com/pulumi/tools/validate_stack_config.py
+"""
+
+import sys
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import yaml
+
+PULUMI_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PULUMI_DIR))
+
+from stacks.traderamp_stack import TradeRampConfiguration  # noqa: E402
+
+
+class StackFileConfig:
+    """
+    Read-only stand-in for pulumi.Config backed by a stack file.
+    
+    Implements the subset of the Config API used by TradeRampConfiguration.
+    """
+    
+    def __init__(self, project: str, values: Dict[str, Any]):
+        """
+        Initialize stack file configuration.
+        
+        Args:
+            project: Project name used to namespace bare keys
+            values: The stack file's `config` mapping
+        """
+        self.project = project
+        self.values = values
+    
+    def get(self, key: str) -> Optional[str]:
+        """Get a config value as a string, or None if unset."""
+        full_key = key if ":" in key else f"{self.project}:{key}"
+        value = self.values.get(full_key)
+        return None if value is None else str(value)
+    
+    def get_int(self, key: str) -> Optional[int]:
+        """Get a config value as an integer, or None if unset."""
+        value = self.get(key)
+        return None if value is None else int(value)
+    
+    def get_float(self, key: str) -> Optional[float]:
+        """Get a config value as a float, or None if unset."""
+        value = self.get(key)
+        return None if value is None else float(value)
+    
+    def get_bool(self, key: str) -> Optional[bool]:
+        """Get a config value as a boolean, or None if unset."""
+        value = self.get(key)
+        if value is None:
+            return None
+        if value.lower() in ("true", "false"):
+            return value.lower() == "true"
+        raise ValueError(f"{key} must be true or false, got {value!r}")
+
+
+def validate_stack_file(project: str, stack_file: Path) -> None:
+    """
+    Validate one stack file.
+    
+    Args:
+        project: Pulumi project name
+        stack_file: Path to Pulumi.<stack>.yaml
+        
+    Raises:
+        ValueError: If a value is malformed or fails validation
+    """
+    values = (yaml.safe_load(stack_file.read_text()) or {}).get("config") or {}
+    TradeRampConfiguration(StackFileConfig(project, values)).validate()
+
+
+def main() -> int:
+    """Validate every stack file and report failures."""
+    project = yaml.safe_load((PULUMI_DIR / "Pulumi.yaml").read_text())["name"]
+    failed = False
+    
+    for stack_file in sorted(PULUMI_DIR.glob("Pulumi.*.yaml")):
+        try:
+            validate_stack_file(project, stack_file)
+            print(f"{stack_file.name}: ok")
+        except ValueError as error:
+            print(f"{stack_file.name}: {error}", file=sys.stderr)
+            failed = True
+    
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -4,148 +4,236 @@ Production Test Suite for TradeRamp
 Tests the deployed AWS infrastructure
 """
 
+import re
 import requests
+import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from typing import Dict, List
 
-class Colors:
-    GREEN = '\033[92m'
-    YELLOW = '\033[93m'
-    RED = '\033[91m'
-    BLUE = '\033[94m'
-    END = '\033[0m'
-    BOLD = '\033[1m'
+from requests.adapters import HTTPAdapter
+
+# Shared keep-alive session so probes reuse connections to each host
+SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_maxsize=16)
+SESSION.mount("https://", _ADAPTER)
+SESSION.mount("http://", _ADAPTER)
+
+# Request timeout in seconds
+TIMEOUT = 10
+
+# Deployed endpoints
+BASE_ALB = "http://traderamp-dev-alb-95b0200-1783108054.us-east-1.elb.amazonaws.com"
+BASE_CF = "https://d16blg9x9q03wx.cloudfront.net"
+
+# (name, url, expected status[, content marker]) for each endpoint test
+ALB_TESTS = (
+    ("ALB Homepage", f"{BASE_ALB}/", 200, "Fill Your Calendar with High-Paying Jobs"),
+    ("ALB Privacy Policy", f"{BASE_ALB}/privacy-policy.html", 200, "Privacy Policy"),
+    ("ALB Sitemap", f"{BASE_ALB}/sitemap.xml", 200, "urlset"),
+    ("ALB Robots.txt", f"{BASE_ALB}/robots.txt", 200, "User-agent"),
+    ("ALB Health Check", f"{BASE_ALB}/health", 200, "OK"),
+)
+
+CF_TESTS = (
+    ("CloudFront Homepage", f"{BASE_CF}/", 200, "TradeRamp"),
+    ("CloudFront HTTPS Redirect", f"{BASE_CF}/", 200),
+    ("CloudFront Caching", f"{BASE_CF}/assets/css/main.css", 200),
+)
+
+# SEO element -> markers that must all appear in the page
+SEO_MARKERS = {
+    'title': (b'<title>', b'</title>'),
+    'meta_description': (b'name="description"',),
+    'h1_tag': (b'<h1',),
+    'canonical': (b'rel="canonical"',),
+    'og_tags': (b'property="og:',),
+    'schema': (b'application/ld+json',),
+    'sitemap_ref': (b'sitemap.xml',)
+}
+
+# Every marker in one alternation, so a page is scanned once
+SEO_RE = re.compile(
+    b"|".join(re.escape(marker) for markers in SEO_MARKERS.values() for marker in markers)
+)
+
+# ANSI colours, left empty when output is not a terminal (CI logs, redirects)
+_IS_TTY = sys.stdout.isatty()
+GREEN = '\033[92m' if _IS_TTY else ''
+YELLOW = '\033[93m' if _IS_TTY else ''
+RED = '\033[91m' if _IS_TTY else ''
+BLUE = '\033[94m' if _IS_TTY else ''
+END = '\033[0m' if _IS_TTY else ''
+BOLD = '\033[1m' if _IS_TTY else ''
+
+def _body_contains(response: requests.Response, marker: bytes, limit: int) -> bool:
+    """Scan the start of a streamed body, stopping as soon as marker is seen"""
+    buffer = bytearray()
+    for chunk in response.iter_content(chunk_size=8192):
+        buffer += chunk
+        if marker in buffer:
+            return True
+        if len(buffer) >= limit:
+            break
+    return False
 
 def test_endpoint(name: str, url: str, expected_status: int = 200, 
-                 check_content: str = None) -> Dict:
-    """Test a single endpoint"""
-    print(f"\n{Colors.BLUE}Testing {name}...{Colors.END}")
+                 check_content: str = None, content_prefix_bytes: int = 32768) -> Dict:
+    """Test a single endpoint (results are printed by print_endpoint_result)
+    
+    Status-only checks use HEAD; content checks stream the body and read at
+    most content_prefix_bytes of it.
+    """
+    result = {
+        'name': name,
+        'url': url,
+        'expected_status': expected_status,
+        'check_content': check_content
+    }
     
     try:
         start = time.time()
-        response = requests.get(url, timeout=10)
+        if check_content is None:
+            response = SESSION.head(url, timeout=TIMEOUT, allow_redirects=True)
+        else:
+            response = SESSION.get(url, timeout=TIMEOUT, stream=True)
+        
+        with response:
+            success = response.status_code == expected_status
+            if check_content and success:
+                content_found = _body_contains(
+                    response, check_content.encode(), content_prefix_bytes
+                )
+            else:
+                content_found = None
         elapsed = time.time() - start
         
-        result = {
-            'url': url,
+        result.update({
             'status': response.status_code,
             'time': elapsed,
-            'success': response.status_code == expected_status
-        }
-        
-        if check_content and result['success']:
-            result['content_found'] = check_content in response.text
-        else:
-            result['content_found'] = None
-            
-        # Print results
-        status_color = Colors.GREEN if result['success'] else Colors.RED
-        print(f"  Status: {status_color}{response.status_code}{Colors.END} (expected {expected_status})")
-        print(f"  Response Time: {elapsed:.3f}s")
-        
-        if check_content:
-            content_color = Colors.GREEN if result.get('content_found') else Colors.RED
-            content_status = "✓ Found" if result.get('content_found') else "✗ Not Found"
-            print(f"  Content Check: {content_color}{content_status}{Colors.END}")
+            'success': success,
+            'content_found': content_found
+        })
             
         return result
         
     except Exception as e:
-        print(f"  {Colors.RED}Error: {e}{Colors.END}")
-        return {
-            'url': url,
+        result.update({
             'status': 0,
             'time': 0,
             'success': False,
             'error': str(e)
-        }
+        })
+        return result
+
+def print_endpoint_result(result: Dict) -> None:
+    """Print the outcome of a single endpoint test"""
+    print(f"\n{BLUE}Testing {result['name']}...{END}")
+    
+    if 'error' in result:
+        print(f"  {RED}Error: {result['error']}{END}")
+        return
+    
+    status_color = GREEN if result['success'] else RED
+    print(f"  Status: {status_color}{result['status']}{END} (expected {result['expected_status']})")
+    print(f"  Response Time: {result['time']:.3f}s")
+    
+    if result['check_content']:
+        content_color = GREEN if result.get('content_found') else RED
+        content_status = "✓ Found" if result.get('content_found') else "✗ Not Found"
+        print(f"  Content Check: {content_color}{content_status}{END}")
 
 def test_seo_elements(url: str) -> Dict:
     """Test SEO elements on a page"""
-    print(f"\n{Colors.BLUE}Testing SEO elements...{Colors.END}")
-    
     try:
-        response = requests.get(url, timeout=10)
-        content = response.text
+        response = SESSION.get(url, timeout=TIMEOUT)
+        found = set(SEO_RE.findall(response.content))
         
         checks = {
-            'title': '<title>' in content and '</title>' in content,
-            'meta_description': 'name="description"' in content,
-            'h1_tag': '<h1' in content,
-            'canonical': 'rel="canonical"' in content,
-            'og_tags': 'property="og:' in content,
-            'schema': 'application/ld+json' in content,
-            'sitemap_ref': 'sitemap.xml' in content
+            element: all(marker in found for marker in markers)
+            for element, markers in SEO_MARKERS.items()
         }
         
-        for element, found in checks.items():
-            color = Colors.GREEN if found else Colors.YELLOW
-            status = "✓" if found else "⚠"
-            print(f"  {color}{status} {element.replace('_', ' ').title()}{Colors.END}")
-            
         return checks
         
     except Exception as e:
-        print(f"  {Colors.RED}Error: {e}{Colors.END}")
-        return {}
+        return {'error': str(e)}
+
+def print_seo_results(checks: Dict) -> None:
+    """Print the outcome of the SEO element checks"""
+    print(f"\n{BLUE}Testing SEO elements...{END}")
+    
+    if 'error' in checks:
+        print(f"  {RED}Error: {checks['error']}{END}")
+        return
+    
+    for element, found in checks.items():
+        color = GREEN if found else YELLOW
+        status = "✓" if found else "⚠"
+        print(f"  {color}{status} {element.replace('_', ' ').title()}{END}")
+
+def average_response_time(results: List[Dict], skip_failed: bool = False) -> float:
+    """Average response time in a single pass
+    
+    Failed tests record a time of 0; skip_failed leaves them out of the average.
+    """
+    total = 0.0
+    count = 0
+    for result in results:
+        elapsed = result['time']
+        if elapsed > 0 or not skip_failed:
+            total += elapsed
+            count += 1
+    return total / count if count else 0.0
 
 def run_production_tests():
     """Run all production tests"""
-    print(f"\n{Colors.BOLD}=== TradeRamp Production Tests ==={Colors.END}")
+    print(f"\n{BOLD}=== TradeRamp Production Tests ==={END}")
+    
+    # Probes are network-bound, so run them all at once and print in order after
+    worker_count = min(16, len(ALB_TESTS) + len(CF_TESTS) + 1)
+    with ThreadPoolExecutor(max_workers=worker_count) as executor:
+        seo_future = executor.submit(test_seo_elements, f"{BASE_ALB}/")
+        futures = [executor.submit(test_endpoint, *test) for test in chain(ALB_TESTS, CF_TESTS)]
+        results = [future.result() for future in futures]
+        seo_results = seo_future.result()
     
-    # Define endpoints
-    base_alb = "http://traderamp-dev-alb-95b0200-1783108054.us-east-1.elb.amazonaws.com"
-    base_cf = "https://d16blg9x9q03wx.cloudfront.net"
+    alb_results = results[:len(ALB_TESTS)]
+    cf_results = results[len(ALB_TESTS):]
     
     # Test ALB endpoints
-    print(f"\n{Colors.BOLD}1. Application Load Balancer Tests{Colors.END}")
-    alb_tests = [
-        ("ALB Homepage", f"{base_alb}/", 200, "Fill Your Calendar with High-Paying Jobs"),
-        ("ALB Privacy Policy", f"{base_alb}/privacy-policy.html", 200, "Privacy Policy"),
-        ("ALB Sitemap", f"{base_alb}/sitemap.xml", 200, "urlset"),
-        ("ALB Robots.txt", f"{base_alb}/robots.txt", 200, "User-agent"),
-        ("ALB Health Check", f"{base_alb}/health", 200, "OK"),
-    ]
-    
-    alb_results = []
-    for test in alb_tests:
-        result = test_endpoint(*test)
-        alb_results.append(result)
+    print(f"\n{BOLD}1. Application Load Balancer Tests{END}")
+    for result in alb_results:
+        print_endpoint_result(result)
     
     # Test CloudFront
-    print(f"\n{Colors.BOLD}2. CloudFront CDN Tests{Colors.END}")
-    cf_tests = [
-        ("CloudFront Homepage", f"{base_cf}/", 200, "TradeRamp"),
-        ("CloudFront HTTPS Redirect", f"{base_cf}/", 200),
-        ("CloudFront Caching", f"{base_cf}/assets/css/main.css", 200),
-    ]
-    
-    cf_results = []
-    for test in cf_tests:
-        result = test_endpoint(*test)
-        cf_results.append(result)
+    print(f"\n{BOLD}2. CloudFront CDN Tests{END}")
+    for result in cf_results:
+        print_endpoint_result(result)
     
     # Test SEO
-    print(f"\n{Colors.BOLD}3. SEO Implementation Tests{Colors.END}")
-    seo_results = test_seo_elements(f"{base_alb}/")
+    print(f"\n{BOLD}3. SEO Implementation Tests{END}")
+    print_seo_results(seo_results)
+    seo_results.pop('error', None)  # A failed fetch counts as no SEO elements
     
     # Summary
-    print(f"\n{Colors.BOLD}=== Test Summary ==={Colors.END}")
+    print(f"\n{BOLD}=== Test Summary ==={END}")
     
     total_tests = len(alb_results) + len(cf_results)
     passed_tests = sum(1 for r in alb_results + cf_results if r['success'])
     
-    print(f"\nEndpoint Tests: {Colors.GREEN if passed_tests == total_tests else Colors.YELLOW}"
-          f"{passed_tests}/{total_tests} passed{Colors.END}")
+    print(f"\nEndpoint Tests: {GREEN if passed_tests == total_tests else YELLOW}"
+          f"{passed_tests}/{total_tests} passed{END}")
     
     seo_passed = sum(1 for v in seo_results.values() if v)
     seo_total = len(seo_results)
-    print(f"SEO Elements: {Colors.GREEN if seo_passed == seo_total else Colors.YELLOW}"
-          f"{seo_passed}/{seo_total} implemented{Colors.END}")
+    print(f"SEO Elements: {GREEN if seo_passed == seo_total else YELLOW}"
+          f"{seo_passed}/{seo_total} implemented{END}")
     
     # Performance
-    avg_alb_time = sum(r['time'] for r in alb_results) / len(alb_results)
-    avg_cf_time = sum(r['time'] for r in cf_results if r['time'] > 0) / len([r for r in cf_results if r['time'] > 0])
+    avg_alb_time = average_response_time(alb_results)
+    avg_cf_time = average_response_time(cf_results, skip_failed=True)
     
     print(f"\nPerformance:")
     print(f"  ALB Average Response: {avg_alb_time:.3f}s")
@@ -153,9 +241,9 @@ def run_production_tests():
     
     # Overall status
     if passed_tests == total_tests and seo_passed == seo_total:
-        print(f"\n{Colors.GREEN}{Colors.BOLD}✓ All production tests passed!{Colors.END}")
+        print(f"\n{GREEN}{BOLD}✓ All production tests passed!{END}")
     else:
-        print(f"\n{Colors.YELLOW}{Colors.BOLD}⚠ Some tests need attention{Colors.END}")
+        print(f"\n{YELLOW}{BOLD}⚠ Some tests need attention{END}")
 
 if __name__ == "__main__":
     run_production_tests()
\ No newline at end of file